@@ -1,54 +1,144 @@
 import enum
+import struct
+from collections.abc import Sequence
 from dataclasses import dataclass
-
-
-class DynamixelSeries(enum.Enum):
-    """Dynamixelシリーズの列挙型"""
-
-    XM430_W350 = 1
-    XM540_W270 = 2
+from typing import Final
+
+__all__ = [
+    "DynamixelSeries",
+    "Param",
+    "PRESENT_STATE_CODEC",
+    "build_indirect_plan",
+    "POSITION_CURRENT_INDIRECT_PLAN",
+    "S_U8",
+    "S_U16",
+    "S_U32",
+    "S_S32",
+    "ma_to_current",
+    "OperatingMode",
+    "ControlParams",
+    "PARAM",
+    "DynamixelParams",
+    "ProtocolVersion",
+    "Baudrate",
+    "DEFAULT_BAUDRATE",
+    "BAUDRATE_REGISTER_VALUES",
+]
+
+
+class DynamixelSeries(enum.IntEnum):
+    """Dynamixelシリーズの列挙型 (値はModel Numberレジスタの値)"""
+
+    XM430_W350 = 1020
+    XM540_W270 = 1120
     # 他のシリーズもここに追加可能
 
 
-@dataclass
 class Param:
     """
     Dynamixel XM430-W350-Rのパラメータ
     """
 
+    __slots__ = ()
+
     # Control Table Addresses #
-    ADDR_TORQUE_ENABLE = 64
-    ADDR_OPERATING_MODE = 11
+    ADDR_MODEL_NUMBER: Final[int] = 0  # EEPROM (2byte, 読み取り専用)
+    ADDR_TORQUE_ENABLE: Final[int] = 64
+    ADDR_OPERATING_MODE: Final[int] = 11
+    ADDR_STATUS_RETURN_LEVEL: Final[int] = 68
+    ADDR_RETURN_DELAY_TIME: Final[int] = 9  # EEPROM (単位 2us, 既定値 250)
+    ADDR_BAUD_RATE: Final[int] = 8  # EEPROM (値は BAUDRATE_REGISTER_VALUES を参照)
 
     # Position Control
-    ADDR_GOAL_POSITION = 116
-    ADDR_PRESENT_POSITION = 132
+    ADDR_GOAL_POSITION: Final[int] = 116
+    ADDR_PRESENT_POSITION: Final[int] = 132
+    ADDR_MOVING: Final[int] = 122  # 1: 移動中, 0: 停止 (現在速度がしきい値以下)
 
     # Velocity Control
-    ADDR_GOAL_VELOCITY = 104
-    ADDR_PRESENT_VELOCITY = 128
+    ADDR_GOAL_VELOCITY: Final[int] = 104
+    ADDR_PRESENT_VELOCITY: Final[int] = 128
 
     # PWM Control
-    ADDR_GOAL_PWM = 100
-    ADDR_PRESENT_PWM = 124
+    ADDR_GOAL_PWM: Final[int] = 100
+    ADDR_PRESENT_PWM: Final[int] = 124
 
     # Current Control
-    ADDR_GOAL_CURRENT = 102
-    ADDR_PRESENT_CURRENT = 126
+    ADDR_GOAL_CURRENT: Final[int] = 102
+    ADDR_PRESENT_CURRENT: Final[int] = 126
+
+    # Present Current / Velocity / Position は連続した領域なので一度に読み取れる
+    SYNC_READ_START: Final[int] = 126  # ADDR_PRESENT_CURRENT
+    SYNC_READ_LEN: Final[int] = 10  # current(2) + velocity(4) + position(4)
+
+    # Indirect Address (2byte x 28) / Indirect Data (1byte x 28)
+    ADDR_INDIRECT_ADDRESS_BLOCK: Final[int] = 168
+    ADDR_INDIRECT_DATA_BLOCK: Final[int] = 224
     ###############################
 
     # Dynamixel Parameters #
-    TORQUE_ENABLE = 1
-    TORQUE_DISABLE = 0
-    RESOLUTION = 4096  # 0-4095 (12-bit)
-    PULSE_PER_REVOLUTION = 4096  # 1回転あたりのパルス数
+    TORQUE_ENABLE: Final[int] = 1
+    TORQUE_DISABLE: Final[int] = 0
+    STATUS_RETURN_PING_READ: Final[int] = 1  # Ping/Read命令にのみ応答する
+    STATUS_RETURN_ALL: Final[int] = 2  # 全ての命令に応答する (初期値)
+    RESOLUTION: Final[int] = 4096  # 0-4095 (12-bit)
+    PULSE_PER_REVOLUTION: Final[int] = 4096  # 1回転あたりのパルス数
 
     # Current conversion parameters
-    CURRENT_UNIT = 2.69  # mA per unit (XM430-W350)
-    MAX_CURRENT = 1193  # mA (maximum current)
+    CURRENT_UNIT: Final[float] = 2.69  # mA per unit (XM430-W350)
+    MAX_CURRENT: Final[int] = 1193  # mA (maximum current)
+
+    # PWM parameters
+    MAX_PWM: Final[int] = 885  # 0.113% per unit (PWM Limit の最大値)
 
 
-class OperatingMode(enum.Enum):
+# SYNC_READ_START から SYNC_READ_LEN バイトを (current, velocity, position) に一括変換する
+PRESENT_STATE_CODEC: Final[struct.Struct] = struct.Struct("<hii")
+
+
+def build_indirect_plan(regs: Sequence[tuple[int, int]]) -> bytes:
+    """
+    Indirect Address に書き込むアドレス列を生成します。
+    regs: [(address, length), ...]
+
+    生成したバイト列を ADDR_INDIRECT_ADDRESS_BLOCK に一度書き込むと、
+    各レジスタが ADDR_INDIRECT_DATA_BLOCK 以降に regs の順で連続して並び、
+    1回の SyncWrite でまとめて書き込めるようになります。
+    (注: Indirect Address はトルクOFF中に書き込む必要があります)
+    """
+    plan = bytearray()
+    for address, length in regs:
+        for i in range(length):
+            plan += (address + i).to_bytes(2, "little")
+    return bytes(plan)
+
+
+# 目標位置(4byte)・目標電流(2byte)を連続領域にまとめるプラン
+# (set_position_and_current_goals_async で1回の SyncWrite にするために使う)
+POSITION_CURRENT_INDIRECT_PLAN: Final[bytes] = build_indirect_plan(
+    (
+        (Param.ADDR_GOAL_POSITION, 4),
+        (Param.ADDR_GOAL_CURRENT, 2),
+    )
+)
+
+
+# データ長・符号ごとのリトルエンディアン変換器 (フォーマット文字列の解析は一度だけ)
+S_U8: Final[struct.Struct] = struct.Struct("<B")
+S_U16: Final[struct.Struct] = struct.Struct("<H")
+S_U32: Final[struct.Struct] = struct.Struct("<I")
+S_S32: Final[struct.Struct] = struct.Struct("<i")
+
+
+# 電流換算用の逆数 (除算を乗算に置き換えるため事前に計算)
+_INV_CURRENT_UNIT: Final[float] = 1.0 / Param.CURRENT_UNIT
+
+
+def ma_to_current(ma: float) -> int:
+    """電流値(mA)をDynamixel内部単位に変換します。"""
+    return round(ma * _INV_CURRENT_UNIT)
+
+
+class OperatingMode(enum.IntEnum):
     """
     Dynamixelのオペレーティングモード
     """
@@ -61,7 +151,7 @@ class OperatingMode(enum.Enum):
     PWM_CONTROL = 16
 
 
-@dataclass
+@dataclass(slots=True, kw_only=True)
 class ControlParams:
     """Dynamixelモーターの制御パラメータ"""
 
@@ -72,6 +162,18 @@ class ControlParams:
     # 制御パラメータ
     ctrl_mode: OperatingMode = OperatingMode.POSITION_CONTROL
     offset: int = 0  # オフセット値（デフォルトは0）
+    # 接続時に Return Delay Time (応答までの待ち時間) を0にするか
+    zero_return_delay: bool = True
+
+
+# 全シリーズ共通のコントロールテーブル (状態を持たないので1つを共有する)
+PARAM: Final[Param] = Param()
+
+# シリーズごとのコントロールテーブル
+_PARAM_BY_SERIES: dict[DynamixelSeries, Param] = {
+    DynamixelSeries.XM430_W350: PARAM,
+    DynamixelSeries.XM540_W270: PARAM,
+}
 
 
 class DynamixelParams:
@@ -79,27 +181,47 @@ class DynamixelParams:
 
     def __init__(self, series: DynamixelSeries):
         self.series = series
-        # 他の初期化コード
+        # コントロールテーブルは生成時に一度だけ解決しておく
+        try:
+            self._param = _PARAM_BY_SERIES[series]
+        except KeyError:
+            raise ValueError("Unsupported Dynamixel series") from None
 
     @property
     def param(self) -> Param:
         """Dynamixelシリーズに応じたコントロールテーブルを返す"""
-        if self.series == DynamixelSeries.XM430_W350:
-            return Param()
-        elif self.series == DynamixelSeries.XM540_W270:
-            return Param()
-        else:
-            raise ValueError("Unsupported Dynamixel series")
+        return self._param
 
 
-class ProtocolVersion(enum.Enum):
+class ProtocolVersion(enum.IntEnum):
     """Dynamixelのプロトコルバージョン"""
 
-    V1_0 = 1.0
-    V2_0 = 2.0
+    V1_0 = 1
+    V2_0 = 2
 
 
-class Baudrate(enum.Enum):
+class Baudrate(enum.IntEnum):
     """Dynamixelの通信速度（ボーレート）"""
 
     BAUD_57600 = 57600
+    BAUD_115200 = 115200
+    BAUD_1M = 1_000_000
+    BAUD_2M = 2_000_000
+    BAUD_3M = 3_000_000
+    BAUD_4M = 4_000_000
+
+
+# 既定の通信速度
+# 注意: モーター側のBaud Rate(EEPROM)も同じ値に設定しておく必要があります
+# (工場出荷時は57600bps)
+DEFAULT_BAUDRATE: Final[Baudrate] = Baudrate.BAUD_1M
+
+# コントロールテーブルの Baud Rate(8) に書き込む値
+BAUDRATE_REGISTER_VALUES: Final[dict[Baudrate, int]] = {
+    Baudrate.BAUD_57600: 1,
+    Baudrate.BAUD_115200: 2,
+    Baudrate.BAUD_1M: 3,
+    Baudrate.BAUD_2M: 4,
+    Baudrate.BAUD_3M: 5,
+    Baudrate.BAUD_4M: 6,
+}
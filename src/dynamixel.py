@@ -1,11 +1,31 @@
 import asyncio
 import logging
+import math
+import os
+import select
+import sys
+from concurrent.futures import ThreadPoolExecutor
 from logging import Formatter, StreamHandler, getLogger
-from typing import Any
-
-from dynamixel_sdk import GroupSyncRead, GroupSyncWrite, PacketHandler, PortHandler
+from typing import Any, Callable, Iterable, TypeVar
+
+from dynamixel_sdk import (
+    BROADCAST_ID,
+    GroupSyncRead,
+    GroupSyncWrite,
+    PacketHandler,
+    PortHandler,
+)
 
 from .constants import (
+    BAUDRATE_REGISTER_VALUES,
+    DEFAULT_BAUDRATE,
+    PARAM,
+    POSITION_CURRENT_INDIRECT_PLAN,
+    PRESENT_STATE_CODEC,
+    S_S32,
+    S_U8,
+    S_U16,
+    S_U32,
     Baudrate,
     ControlParams,
     DynamixelParams,
@@ -23,41 +43,251 @@ stream_handler.setLevel(logging.INFO)
 stream_handler.setFormatter(handler_format)
 logger.addHandler(stream_handler)
 
+_T = TypeVar("_T")
+
 
 # Byte conversion helper functions
+# 事前コンパイル済みの struct.Struct で変換する (負の値はマスクで2の補数表現にする)
 def int_to_1byte(value: int) -> list[int]:
     """1バイトの整数をバイト配列に変換します。"""
-    return [value & 0xFF]
+    return list(S_U8.pack(value & 0xFF))
 
 
 def int_to_2byte_list(value: int) -> list[int]:
     """2バイトの整数をバイト配列に変換します。"""
-    # 負の値を16bit符号なし整数として扱う
-    if value < 0:
-        value += 65536
-    return [value & 0xFF, (value >> 8) & 0xFF]
+    return list(S_U16.pack(value & 0xFFFF))
 
 
 def int_to_4byte_list(value: int) -> list[int]:
     """4バイトの整数をバイト配列に変換します (SDKのサンプルに準拠)。"""
-    # 負の値を32bit符号なし整数として扱う
-    if value < 0:
-        value += 4294967296
-    return [
-        value & 0xFF,
-        (value >> 8) & 0xFF,
-        (value >> 16) & 0xFF,
-        (value >> 24) & 0xFF,
-    ]
+    return list(S_U32.pack(value & 0xFFFFFFFF))
 
 
 def bytes_to_4byte_int(value_bytes: bytes) -> int:
     """4バイトのバイト配列を符号付き整数に変換します。"""
-    value = int.from_bytes(value_bytes, byteorder="little", signed=True)
-    return value
+    return S_S32.unpack(value_bytes)[0]
+
+
+# Linux の USB シリアル (FTDI) 設定用
+_TIOCGSERIAL = 0x541E
+_TIOCSSERIAL = 0x541F
+_ASYNC_LOW_LATENCY = 1 << 13
+_SERIAL_FLAGS_OFFSET = 16  # struct serial_struct の flags のオフセット
+# 既定のレイテンシタイマ (ms)
+_DEFAULT_LATENCY_TIMER_MS = 1
+# Windows の FTDI ドライバ (VCP) の設定が置かれるレジストリキー
+_FTDIBUS_REGISTRY_KEY = r"SYSTEM\CurrentControlSet\Enum\FTDIBUS"
+
+
+def _set_low_latency(
+    port_handler: PortHandler, latency_ms: int = _DEFAULT_LATENCY_TIMER_MS
+) -> bool:
+    """
+    USBシリアル(FTDI)のレイテンシタイマを latency_ms にします (Linuxのみ)。
+    1ms の場合は low_latency フラグも立てます。
+    既定の16msのままだと、応答パケットの受信ごとに最大16ms待たされます。
+    Windows ではドライバの設定を確認し、latency_ms より大きければ警告します。
+    戻り値はレイテンシタイマが latency_ms 以下であることを確認できたかどうかです。
+    """
+    if sys.platform == "win32":
+        return _check_windows_latency_timer(port_handler.getPortName(), latency_ms)
+    if not sys.platform.startswith("linux"):
+        return False
+
+    import fcntl
+
+    tty = os.path.basename(os.path.realpath(port_handler.getPortName()))
+    path = f"/sys/bus/usb-serial/devices/{tty}/latency_timer"
+    before = None
+    try:
+        with open(path) as f:
+            before = f.read().strip()
+        with open(path, "w") as f:
+            f.write(str(latency_ms))
+    except OSError as e:
+        # 書き込み権限がなくても、1ms なら下の low_latency フラグで設定できる
+        logger.warning(f"Failed to set latency timer of {tty}: {e}")
+
+    # low_latency フラグを立てるとドライバがタイマを1msにするので、1ms のときだけ使う
+    if latency_ms <= 1:
+        try:
+            buf = bytearray(128)
+            fcntl.ioctl(port_handler.ser.fileno(), _TIOCGSERIAL, buf)
+            flags = int.from_bytes(
+                buf[_SERIAL_FLAGS_OFFSET : _SERIAL_FLAGS_OFFSET + 4], "little"
+            )
+            buf[_SERIAL_FLAGS_OFFSET : _SERIAL_FLAGS_OFFSET + 4] = (
+                flags | _ASYNC_LOW_LATENCY
+            ).to_bytes(4, "little")
+            fcntl.ioctl(port_handler.ser.fileno(), _TIOCSSERIAL, buf)
+        except OSError as e:
+            logger.warning(f"Failed to set low_latency flag of {tty}: {e}")
+
+    # 実際に反映された値を読み直して確認する
+    try:
+        with open(path) as f:
+            after = int(f.read().strip())
+    except (OSError, ValueError) as e:
+        logger.warning(f"Failed to verify latency timer of {tty}: {e}")
+        return False
+    if after > latency_ms:
+        logger.warning(
+            f"Latency timer of {tty} is {after} ms; "
+            f"every reply may be delayed by up to {after} ms"
+        )
+        return False
+    logger.info(f"Latency timer of {tty}: {before} ms -> {after} ms")
+    return True
+
+
+def _check_windows_latency_timer(port_name: str, latency_ms: int) -> bool:
+    """
+    Windows の FTDI ドライバに設定されたレイテンシタイマを確認します。
+    変更には管理者権限と再接続が必要なので、ここでは書き換えずに警告だけ出します。
+    """
+    import winreg
+
+    latency = None
+    try:
+        with winreg.OpenKey(winreg.HKEY_LOCAL_MACHINE, _FTDIBUS_REGISTRY_KEY) as root:
+            index = 0
+            while latency is None:
+                device = winreg.EnumKey(root, index)
+                index += 1
+                try:
+                    with winreg.OpenKey(
+                        root, rf"{device}\0000\Device Parameters"
+                    ) as params:
+                        if winreg.QueryValueEx(params, "PortName")[0] != port_name:
+                            continue
+                        latency = winreg.QueryValueEx(params, "LatencyTimer")[0]
+                except OSError:
+                    continue
+    except OSError:
+        # FTDIBUS 以下を列挙し終えても見つからなかった (または読み取れなかった)
+        pass
+
+    if latency is None:
+        logger.warning(f"Could not verify the latency timer of {port_name}")
+        return False
+    if latency > latency_ms:
+        logger.warning(
+            f"Latency timer of {port_name} is {latency} ms; set it to {latency_ms} ms in "
+            "Device Manager (Port Settings > Advanced > Latency Timer)"
+        )
+        return False
+    return True
+
+
+# シリアルポートのファイルディスクリプタを select で待てるか (Windows では不可)
+_CAN_SELECT_SERIAL = os.name == "posix"
+
+
+# モーターの停止を待つ際の設定 (wait_until_stopped_async, 終了時の速度制御モードの停止)
+_STOP_VELOCITY_THRESHOLD = 2  # 停止とみなす現在速度 (単位 0.229rpm)
+_STOP_TIMEOUT = 0.2  # 停止を待つ最大時間 (秒)
+_STOP_POLL_INTERVAL = 0.005  # 現在速度を確認する間隔 (秒)
+
+# 目標位置への到達を待つ際の設定 (wait_until_reached_async)
+# 残りの偏差がこのパルス数を下回ると、偏差に比例して確認の間隔を短くする
+_REACH_SLOWDOWN_PULSES = 200
+_REACH_MIN_POLL_INTERVAL = 0.002  # 現在位置を確認する最短の間隔 (秒)
+
+
+def _radian_to_pulse(radian: float, pulse_per_rad: float) -> int:
+    """radian値を、事前に計算した変換係数でパルス値に変換します (0方向に切り捨て)。"""
+    return int(radian * pulse_per_rad)
+
+
+class _WaitingPortHandler(PortHandler):
+    """
+    受信データが届くまで select で待機する PortHandler です (POSIXのみ)。
+    SDK の PortHandler はタイムアウト0の read をパケットが揃うまで繰り返すため、
+    応答待ちの間 CPU を使い続け、イベントループのスレッドと GIL を奪い合います。
+    受信バッファが空のときはデータ到着 (またはパケットタイムアウト) まで眠らせます。
+    """
+
+    def readPort(self, length: int) -> bytes:
+        ser = self.ser
+        if _CAN_SELECT_SERIAL and ser.in_waiting == 0:
+            remaining_ms = self.packet_timeout - self.getTimeSinceStart()
+            if remaining_ms > 0:
+                select.select([ser.fileno()], [], [], remaining_ms / 1000.0)
+        return ser.read(length)
+
+
+def _configure_io_thread(priority: int | None, cpu: int | None) -> None:
+    """
+    シリアルI/Oスレッドの開始時に、CPUの固定と実時間優先度(SCHED_FIFO)を設定します。
+    送信から応答受信までの間にスケジューラに割り込まれると、その分だけ応答の処理が遅れます。
+    SCHED_FIFO には CAP_SYS_NICE 権限 (または limits.conf の rtprio) が必要です。
+    Windows では priority を指定した場合、その値によらずスレッド優先度を THREAD_PRIORITY_HIGHEST にします。
+    """
+    if sys.platform == "win32":
+        _configure_windows_io_thread(priority, cpu)
+        return
+    if cpu is not None:
+        try:
+            os.sched_setaffinity(0, {cpu})
+        except (AttributeError, OSError) as e:
+            logger.warning(f"Failed to pin the I/O thread to CPU {cpu}: {e}")
+    if priority is not None:
+        try:
+            os.sched_setscheduler(0, os.SCHED_FIFO, os.sched_param(priority))
+        except (AttributeError, OSError) as e:
+            logger.warning(
+                f"Failed to set SCHED_FIFO priority {priority} for the I/O thread: {e}"
+            )
+
+
+# Windows のスレッド優先度・タイマ分解能の設定用
+_THREAD_PRIORITY_HIGHEST = 2
+_WINDOWS_TIMER_PERIOD_MS = 1
+
+
+def _configure_windows_io_thread(priority: int | None, cpu: int | None) -> None:
+    """シリアルI/Oスレッドの優先度とCPUの固定を Win32 API で設定します。"""
+    import ctypes
+
+    kernel32 = ctypes.WinDLL("kernel32", use_last_error=True)
+    kernel32.GetCurrentThread.restype = ctypes.c_void_p
+    thread = ctypes.c_void_p(kernel32.GetCurrentThread())
+    if cpu is not None and not kernel32.SetThreadAffinityMask(
+        thread, ctypes.c_size_t(1 << cpu)
+    ):
+        logger.warning(
+            f"Failed to pin the I/O thread to CPU {cpu}: "
+            f"error {ctypes.get_last_error()}"
+        )
+    if priority is not None and not kernel32.SetThreadPriority(
+        thread, _THREAD_PRIORITY_HIGHEST
+    ):
+        logger.warning(
+            "Failed to raise the priority of the I/O thread: "
+            f"error {ctypes.get_last_error()}"
+        )
+
+
+def _set_windows_timer_resolution(enable: bool) -> bool:
+    """
+    Windows のタイマ分解能を1msにします (enable=False で元に戻します)。
+    既定の約15.6msのままだと、asyncio.sleep による短い待機が15.6ms単位に丸められます。
+    """
+    import ctypes
+
+    winmm = ctypes.WinDLL("winmm")
+    func = winmm.timeBeginPeriod if enable else winmm.timeEndPeriod
+    if func(_WINDOWS_TIMER_PERIOD_MS) != 0:
+        logger.warning(
+            f"Failed to change the timer resolution to {_WINDOWS_TIMER_PERIOD_MS} ms"
+        )
+        return False
+    return True
 
 
 class Dynamixel:
+    __slots__ = ("dynamixel_params", "control_params", "id")
+
     def __init__(self, series: DynamixelSeries, id: int, param: ControlParams):
         self.dynamixel_params: DynamixelParams = DynamixelParams(series)
         self.control_params: ControlParams = param
@@ -70,14 +300,59 @@ class DynamixelController:
         port: str,
         motors: list[Dynamixel],
         protocol_version: ProtocolVersion = ProtocolVersion.V2_0,
-        baudrate: Baudrate = Baudrate.BAUD_57600,
+        baudrate: Baudrate = DEFAULT_BAUDRATE,
+        status_return_level: int = PARAM.STATUS_RETURN_PING_READ,
+        io_thread_priority: int | None = None,
+        io_thread_cpu: int | None = None,
+        latency_timer_ms: int | None = _DEFAULT_LATENCY_TIMER_MS,
+        fast_sync_read: bool = False,
     ):
         self.port = port
         self.motors = {motor.id: motor for motor in motors}  # IDをキーとする辞書
-        self.portHandler = PortHandler(self.port)
-        self.protocol_version = protocol_version.value
+        self._motor_ids_tuple = tuple(self.motors)
+        # 位置・速度の一斉受信に失敗したときの戻り値 (呼び出し側にはコピーを返す)
+        self._failure_result: dict[int, int | None] = dict.fromkeys(
+            self._motor_ids_tuple
+        )
+        self.portHandler = _WaitingPortHandler(self.port)
+        self.protocol_version = protocol_version
         self.packetHandler = PacketHandler(self.protocol_version)
         self.baudrate = baudrate
+        if baudrate < Baudrate.BAUD_1M:
+            logger.warning(
+                f"Baudrate {baudrate.value} bps is slow; every packet takes "
+                "several ms on the wire. Consider set_motor_baudrate_async() "
+                "to switch the motors to 1 Mbps or faster."
+            )
+        # 接続時に全モーターへ設定する Status Return Level
+        # (STATUS_RETURN_PING_READ なら書き込みに対する応答を待たない)
+        self.status_return_level = status_return_level
+        # 接続時に設定する USBシリアル(FTDI) のレイテンシタイマ (None なら変更しない)
+        self.latency_timer_ms = latency_timer_ms
+        # シリアルI/O専用のスレッド (1ポート1スレッドで送受信を直列化する)
+        # io_thread_priority / io_thread_cpu を指定すると、そのスレッドを
+        # SCHED_FIFO の実時間優先度で動かし、指定したCPUに固定します (Linuxのみ)
+        # スレッドは最初のI/Oで作成し、切断時に終了させる
+        self._io_thread_config = (io_thread_priority, io_thread_cpu)
+        self._io_executor: ThreadPoolExecutor | None = None
+        # Group ハンドラのパラメータ設定から送受信完了までを排他する
+        # (並行したコルーチンが送信中のパラメータを書き換えないようにする)
+        self._io_lock = asyncio.Lock()
+        # バックグラウンドでの現在位置の定期受信 (start_position_polling_async)
+        self._polling_task: asyncio.Task[None] | None = None
+        self._latest_positions: dict[int, int | None] = {}
+        self._positions_updated = asyncio.Event()
+        # バックグラウンドでの受信を止めた例外 (next_positions_async で送出する)
+        self._polling_error: Exception | None = None
+        # set_goal_positions_async の送信待ちの目標位置と、それを送信するタスク
+        self._pending_goal_positions: dict[int, int] = {}
+        self._goal_positions_flush: asyncio.Future[bool] | None = None
+        # Indirect Address の割り当て (_setup_indirect_address_async) が済んでいるか
+        self._indirect_ready = False
+        # 接続時に Status Return Level を変更したモーターの、変更前の値
+        self._original_status_return_levels: dict[int, int] = {}
+        # 接続中に Windows のタイマ分解能を1msにしているか
+        self._timer_resolution_raised = False
 
         # Group ハンドラの初期化
         if not motors:
@@ -87,6 +362,25 @@ class DynamixelController:
         param = motors[0].dynamixel_params.param
         self.param = param
 
+        # モーターごとの定数をIDをキーとするフラットな辞書に展開しておく
+        # (ループ内での motor.control_params.offset のような属性チェーンを避ける)
+        self._offsets: dict[int, int] = {
+            motor_id: motor.control_params.offset
+            for motor_id, motor in self.motors.items()
+        }
+        self._pulse_per_rev: dict[int, int] = {
+            motor_id: motor.dynamixel_params.param.PULSE_PER_REVOLUTION
+            for motor_id, motor in self.motors.items()
+        }
+        # radian -> パルス値 の変換係数 (変換を1回の乗算にするため事前に計算)
+        self._pulse_per_rad: dict[int, float] = {
+            motor_id: ppr / math.tau for motor_id, ppr in self._pulse_per_rev.items()
+        }
+        # パルス値 -> radian の変換係数
+        self._rad_per_pulse: dict[int, float] = {
+            motor_id: math.tau / ppr for motor_id, ppr in self._pulse_per_rev.items()
+        }
+
         # --- GroupSyncWrite ハンドラ ---
         # 目標位置 (4byte) のための GroupSyncWrite
         self.groupWriteGoalPosition = GroupSyncWrite(
@@ -109,188 +403,542 @@ class DynamixelController:
             self.portHandler, self.packetHandler, param.ADDR_GOAL_CURRENT, 2
         )
 
+        # Indirect Address 設定 (目標位置・目標電流を連続領域に割り当てる) のための GroupSyncWrite
+        self.groupWriteIndirectAddress = GroupSyncWrite(
+            self.portHandler,
+            self.packetHandler,
+            param.ADDR_INDIRECT_ADDRESS_BLOCK,
+            len(POSITION_CURRENT_INDIRECT_PLAN),
+        )
+        # 目標位置 (4byte) + 目標電流 (2byte) を Indirect Data 経由で送る GroupSyncWrite
+        self.groupWritePositionCurrent = GroupSyncWrite(
+            self.portHandler, self.packetHandler, param.ADDR_INDIRECT_DATA_BLOCK, 6
+        )
+
+        # SyncWrite のパラメータ用バッファ (モーターごとに確保し、送信のたびに上書きする)
+        self._goal_position_bufs = {motor_id: bytearray(4) for motor_id in self.motors}
+        self._goal_velocity_bufs = {motor_id: bytearray(4) for motor_id in self.motors}
+        self._goal_current_bufs = {motor_id: bytearray(2) for motor_id in self.motors}
+        self._position_current_bufs = {
+            motor_id: bytearray(6) for motor_id in self.motors
+        }
+
+        # Status Return Level (1byte) のための GroupSyncWrite / GroupSyncRead
+        # (接続時に変更前の値を読み取り、切断時に書き戻す)
+        self.groupWriteStatusReturnLevel = GroupSyncWrite(
+            self.portHandler, self.packetHandler, param.ADDR_STATUS_RETURN_LEVEL, 1
+        )
+        self.groupReadStatusReturnLevel = GroupSyncRead(
+            self.portHandler, self.packetHandler, param.ADDR_STATUS_RETURN_LEVEL, 1
+        )
+        for motor_id in self._motor_ids_tuple:
+            self.groupReadStatusReturnLevel.addParam(motor_id)
+
+        # Return Delay Time (1byte) の確認・設定のための GroupSyncRead / GroupSyncWrite
+        # (EEPROM領域なので、0でないモーターにだけ書き込む)
+        self._zero_return_delay_ids = tuple(
+            motor_id
+            for motor_id, motor in self.motors.items()
+            if motor.control_params.zero_return_delay
+        )
+        self.groupReadReturnDelayTime = GroupSyncRead(
+            self.portHandler, self.packetHandler, param.ADDR_RETURN_DELAY_TIME, 1
+        )
+        for motor_id in self._zero_return_delay_ids:
+            self.groupReadReturnDelayTime.addParam(motor_id)
+        self.groupWriteReturnDelayTime = GroupSyncWrite(
+            self.portHandler, self.packetHandler, param.ADDR_RETURN_DELAY_TIME, 1
+        )
+
         # --- GroupSyncRead ハンドラ ---
+        # モデル番号 (2byte) のための GroupSyncRead (接続確認用)
+        self.groupReadModelNumber = GroupSyncRead(
+            self.portHandler, self.packetHandler, param.ADDR_MODEL_NUMBER, 2
+        )
+        for motor_id in self._motor_ids_tuple:
+            self.groupReadModelNumber.addParam(motor_id)
         # 現在位置 (4byte) のための GroupSyncRead
         self.groupReadPresentPosition = GroupSyncRead(
             self.portHandler, self.packetHandler, param.ADDR_PRESENT_POSITION, 4
         )
-
-    def _read_2byte(self, motor_id: int, address: int) -> tuple[int, bool]:
-        """指定したアドレスから2バイトのデータを読み取ります。"""
-        value, dxl_comm_result, dxl_error = self.packetHandler.read2ByteTxRx(
-            self.portHandler, motor_id, address
+        # 現在電流・速度・位置 (連続した10byte) のための GroupSyncRead
+        self.groupReadPresentState = GroupSyncRead(
+            self.portHandler,
+            self.packetHandler,
+            param.SYNC_READ_START,
+            param.SYNC_READ_LEN,
         )
-        if dxl_comm_result != 0:
-            logger.error(self.packetHandler.getTxRxResult(dxl_comm_result))
-            return 0, False
-        if dxl_error != 0:
-            logger.error(self.packetHandler.getRxPacketError(dxl_error))
-            return 0, False
+        # 現在速度 (4byte) のための GroupSyncRead
+        self.groupReadPresentVelocity = GroupSyncRead(
+            self.portHandler, self.packetHandler, param.ADDR_PRESENT_VELOCITY, 4
+        )
+        # Moving (1byte) のための GroupSyncRead
+        self.groupReadMoving = GroupSyncRead(
+            self.portHandler, self.packetHandler, param.ADDR_MOVING, 1
+        )
+        # 読み取り対象は常に全モーターなので、パラメータは生成時に一度だけ登録しておく
+        for group_read in (
+            self.groupReadPresentPosition,
+            self.groupReadPresentState,
+            self.groupReadPresentVelocity,
+            self.groupReadMoving,
+        ):
+            for motor_id in self._motor_ids_tuple:
+                group_read.addParam(motor_id)
+        # 一斉受信に使う関数
+        # fast_sync_read=True なら Fast Sync Read 命令 (0x8A) を使い、全モーターの応答を
+        # 1つのステータスパケットにまとめて受け取る (ヘッダ・CRCがモーター台数分減る)
+        self.fast_sync_read = fast_sync_read
+        self._read_present_position = self._sync_read_func(
+            self.groupReadPresentPosition
+        )
+        self._read_present_state = self._sync_read_func(self.groupReadPresentState)
+        self._read_present_velocity = self._sync_read_func(
+            self.groupReadPresentVelocity
+        )
+        self._read_moving = self._sync_read_func(self.groupReadMoving)
+
+        # --- with構文の開始・終了時に送る固定の設定値 ---
+        self._all_modes = {
+            motor_id: motor.control_params.ctrl_mode
+            for motor_id, motor in self.motors.items()
+        }
+        self._all_torque_on = dict.fromkeys(self.motors, True)
+        # 終了時に速度0を送る速度制御モードのモーター
+        self._velocity_stop = {
+            motor_id: 0
+            for motor_id, mode in self._all_modes.items()
+            if mode == OperatingMode.VELOCITY_CONTROL
+        }
 
-        # 符号付き16bit整数に対応
-        if value > 32767:
-            value = value - 65536
-        return value, True
+    def _sync_read_func(self, group_read: GroupSyncRead) -> Callable[[], int]:
+        """一斉受信に使う GroupSyncRead のメソッドを返します。"""
+        if self.fast_sync_read:
+            return group_read.fastSyncRead
+        return group_read.txRxPacket
+
+    async def _run_io(self, func: Callable[..., _T], *args: Any) -> _T:
+        """ブロッキングなシリアルI/Oを専用スレッドで実行します。"""
+        executor = self._io_executor
+        if executor is None:
+            executor = self._io_executor = ThreadPoolExecutor(
+                max_workers=1,
+                thread_name_prefix=f"dxl-io-{self.port}",
+                initializer=_configure_io_thread,
+                initargs=self._io_thread_config,
+            )
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(executor, func, *args)
 
     def radian_to_pulse(self, radian: float, pulse_per_revolution: int) -> int:
         """radian値をパルス値に変換します."""
-        pulse = int((radian / (2 * 3.14159265359)) * pulse_per_revolution)
+        pulse = int((radian / math.tau) * pulse_per_revolution)
         return pulse
 
+    def radians_to_pulses(self, motor_id: int, radians: Iterable[float]) -> list[int]:
+        """
+        指定したモーターの radian値の列 (軌道など) をまとめてパルス値に変換します。
+        再生前に一度変換しておけば、制御ループ内での変換が不要になります。
+        """
+        pulse_per_rad = self._pulse_per_rad[motor_id]
+        return [_radian_to_pulse(radian, pulse_per_rad) for radian in radians]
+
+    def _radian_goals_to_pulses(self, positions: dict[int, float]) -> dict[int, int]:
+        """{ motor_id: radian } をパルス値に変換します (コントローラーにないIDは除きます)。"""
+        pulse_per_rad = self._pulse_per_rad
+        return {
+            motor_id: _radian_to_pulse(position_rad, pulse_per_rad[motor_id])
+            for motor_id, position_rad in positions.items()
+            if motor_id in pulse_per_rad
+        }
+
     # 非同期・一斉送受信メソッド
 
-    async def set_goal_positions_async(self, positions: dict[int, int]) -> bool:
-        """複数のモーターに目標位置(パルス値)を一斉送信します。"""
+    def _stage_goal_positions(self, positions: dict[int, int]) -> bool:
+        """目標位置を groupWriteGoalPosition のパラメータに設定します (送信はしません)。"""
         self.groupWriteGoalPosition.clearParam()
+        offsets = self._offsets
+        bufs = self._goal_position_bufs
         for motor_id, position in positions.items():
-            if motor_id not in self.motors:
+            if motor_id not in offsets:
                 logger.warning(f"Motor ID {motor_id} not in controller.")
                 continue
 
-            offset = self.motors[motor_id].control_params.offset
-            value_with_offset = position + offset
-            param_bytes = int_to_4byte_list(value_with_offset)
+            param_bytes = bufs[motor_id]
+            S_U32.pack_into(param_bytes, 0, (position + offsets[motor_id]) & 0xFFFFFFFF)
 
             if not self.groupWriteGoalPosition.addParam(motor_id, param_bytes):
                 logger.error(f"Failed to add param for motor ID {motor_id}")
                 return False
+        return True
+
+    def _decode_4byte_sync_read(
+        self, group_read: GroupSyncRead, offsets: dict[int, int] | None = None
+    ) -> dict[int, int | None]:
+        """4byte の GroupSyncRead の受信データを符号付き整数に変換します。"""
+        # rxPacket 後の data_dict には開始アドレスからの受信バイト列が入っているので、
+        # getData を経由せず符号付き4byteとして直接デコードする
+        data_dict = group_read.data_dict
+        results = {}
+        for motor_id in self._motor_ids_tuple:
+            raw = data_dict.get(motor_id)
+            if raw is None or len(raw) < 4:
+                logger.warning(f"Failed to get data for motor ID {motor_id}")
+                results[motor_id] = None
+                continue
+            value = S_S32.unpack_from(bytes(raw))[0]
+            results[motor_id] = value - offsets[motor_id] if offsets else value
+        return results
+
+    async def set_goal_positions_async(self, positions: dict[int, int]) -> bool:
+        """
+        複数のモーターに目標位置(パルス値)を一斉送信します。
+        複数のコルーチンから同時に呼ばれた場合は、送信待ちの目標位置をまとめて
+        1回のSyncWriteで送信します。同じIDに異なる目標位置が指定された場合は
+        後から指定した値だけを送信し、警告を出します (戻り値は全呼び出し元で共通です)。
+        """
+        pending = self._pending_goal_positions
+        if pending:
+            for motor_id, position in positions.items():
+                previous = pending.get(motor_id)
+                if previous is not None and previous != position:
+                    logger.warning(
+                        f"Goal position {previous} for motor ID {motor_id} was "
+                        f"replaced by {position} before it was sent"
+                    )
+        pending.update(positions)
+        flush = self._goal_positions_flush
+        if flush is None:
+            flush = asyncio.ensure_future(self._flush_goal_positions_async())
+            self._goal_positions_flush = flush
+        # 呼び出し元がキャンセルされても、他の呼び出し元の分の送信は続ける
+        return await asyncio.shield(flush)
+
+    async def _flush_goal_positions_async(self) -> bool:
+        """送信待ちの目標位置をまとめて一斉送信します。"""
+        # 同じ周回で呼ばれた他のコルーチンの目標位置も取り込んでから送信する
+        await asyncio.sleep(0)
+        async with self._io_lock:
+            # ここから後に呼ばれた分は次の送信にまとめる
+            positions = self._pending_goal_positions
+            self._pending_goal_positions = {}
+            self._goal_positions_flush = None
+
+            if not self._stage_goal_positions(positions):
+                return False
 
-        # txPacketはブロッキングI/Oなので、別スレッドで実行
-        dxl_comm_result = await asyncio.to_thread(self.groupWriteGoalPosition.txPacket)
+            # txPacketはブロッキングI/Oなので、別スレッドで実行
+            dxl_comm_result = await self._run_io(self.groupWriteGoalPosition.txPacket)
 
-        if dxl_comm_result != 0:
-            logger.error(self.packetHandler.getTxRxResult(dxl_comm_result))
-            return False
+            if dxl_comm_result != 0:
+                logger.error(self.packetHandler.getTxRxResult(dxl_comm_result))
+                return False
 
-        logger.info(f"Set goal positions for {len(positions)} motors.")
-        return True
+            logger.debug("Set goal positions for %d motors.", len(positions))
+            return True
 
     async def get_present_positions_async(self) -> dict[int, int | None]:
         """複数のモーターの現在位置(パルス値)を一斉受信します。"""
-        self.groupReadPresentPosition.clearParam()
-        motor_ids = list(self.motors.keys())
-        for motor_id in motor_ids:
-            if not self.groupReadPresentPosition.addParam(motor_id):
-                logger.error(f"Failed to add param for motor ID {motor_id}")
-                return {mid: None for mid in motor_ids}
+        async with self._io_lock:
+            # 一斉受信はブロッキングI/Oなので、別スレッドで実行
+            dxl_comm_result = await self._run_io(self._read_present_position)
 
-        # txRxPacketはブロッキングI/Oなので、別スレッドで実行
-        dxl_comm_result = await asyncio.to_thread(
-            self.groupReadPresentPosition.txRxPacket
-        )
+            if dxl_comm_result != 0:
+                logger.error(self.packetHandler.getTxRxResult(dxl_comm_result))
+                return self._failure_result.copy()
 
-        if dxl_comm_result != 0:
-            logger.error(self.packetHandler.getTxRxResult(dxl_comm_result))
-            return {mid: None for mid in motor_ids}
+            return self._decode_4byte_sync_read(
+                self.groupReadPresentPosition, self._offsets
+            )
 
-        results = {}
-        for motor_id in motor_ids:
-            # データが利用可能かチェック
-            if self.groupReadPresentPosition.isAvailable(
-                motor_id, self.param.ADDR_PRESENT_POSITION, 4
-            ):
-                # データを取得
-                raw_value = self.groupReadPresentPosition.getData(
-                    motor_id, self.param.ADDR_PRESENT_POSITION, 4
-                )
-                # 4バイトの生データを符号付き整数に変換
-                value = bytes_to_4byte_int(raw_value.to_bytes(4, "little"))
+    async def set_goal_positions_and_get_present_positions_async(
+        self, positions: dict[int, int]
+    ) -> dict[int, int | None]:
+        """
+        目標位置の一斉送信と現在位置の一斉受信を続けて行います。
+        SyncWrite の送信直後に同じI/Oスレッド上で SyncRead を発行するので、
+        制御ループ1周期あたりのスレッド間の受け渡しが1回で済みます。
+        """
+        # 先に呼ばれた set_goal_positions_async の送信待ちを先に送り、
+        # この目標位置が後から古い目標位置で上書きされないようにする
+        flush = self._goal_positions_flush
+        if flush is not None:
+            await asyncio.shield(flush)
+        async with self._io_lock:
+            if not self._stage_goal_positions(positions):
+                return self._failure_result.copy()
+
+            write_result, read_result = await self._run_io(
+                self._write_then_read,
+                self.groupWriteGoalPosition.txPacket,
+                self._read_present_position,
+            )
 
-                offset = self.motors[motor_id].control_params.offset
-                results[motor_id] = value - offset
-            else:
-                logger.warning(f"Failed to get data for motor ID {motor_id}")
-                results[motor_id] = None
+            if write_result != 0:
+                logger.error(self.packetHandler.getTxRxResult(write_result))
+                return self._failure_result.copy()
+            if read_result != 0:
+                logger.error(self.packetHandler.getTxRxResult(read_result))
+                return self._failure_result.copy()
 
-        return results
+            logger.debug("Set goal positions for %d motors.", len(positions))
+            return self._decode_4byte_sync_read(
+                self.groupReadPresentPosition, self._offsets
+            )
+
+    @staticmethod
+    def _write_then_read(
+        tx_func: Callable[[], int], txrx_func: Callable[[], int]
+    ) -> tuple[int, int]:
+        """送信と送受信を続けて実行します (I/Oスレッド上で呼び出されます)。"""
+        write_result = tx_func()
+        if write_result != 0:
+            return write_result, 0
+        return write_result, txrx_func()
+
+    async def get_present_state_async(
+        self,
+    ) -> dict[int, tuple[int, int, int] | None]:
+        """
+        複数のモーターの現在電流・現在速度・現在位置(パルス値)を1回のSyncReadで一斉受信します。
+        戻り値: { motor_id: (current, velocity, position) }
+        """
+        async with self._io_lock:
+            group_read = self.groupReadPresentState
+            dxl_comm_result = await self._run_io(self._read_present_state)
+
+            if dxl_comm_result != 0:
+                logger.error(self.packetHandler.getTxRxResult(dxl_comm_result))
+                return dict.fromkeys(self._motor_ids_tuple)
+
+            data_dict = group_read.data_dict
+            data_length = self.param.SYNC_READ_LEN
+            results = {}
+            offsets = self._offsets
+            for motor_id in self._motor_ids_tuple:
+                raw = data_dict.get(motor_id)
+                if raw is None or len(raw) < data_length:
+                    logger.warning(f"Failed to get data for motor ID {motor_id}")
+                    results[motor_id] = None
+                    continue
+                current, velocity, position = PRESENT_STATE_CODEC.unpack(bytes(raw))
+                results[motor_id] = (current, velocity, position - offsets[motor_id])
+
+            return results
+
+    async def get_present_velocities_async(self) -> dict[int, int | None]:
+        """複数のモーターの現在速度を一斉受信します。"""
+        async with self._io_lock:
+            dxl_comm_result = await self._run_io(self._read_present_velocity)
+
+            if dxl_comm_result != 0:
+                logger.error(self.packetHandler.getTxRxResult(dxl_comm_result))
+                return self._failure_result.copy()
+
+            return self._decode_4byte_sync_read(self.groupReadPresentVelocity)
+
+    async def get_moving_async(self) -> dict[int, bool | None]:
+        """
+        複数のモーターが移動中かどうか (Moving レジスタ) を一斉受信します。
+        応答は1byteなので、現在位置を読むより短いパケットで停止を確認できます。
+        """
+        async with self._io_lock:
+            dxl_comm_result = await self._run_io(self._read_moving)
+
+            if dxl_comm_result != 0:
+                logger.error(self.packetHandler.getTxRxResult(dxl_comm_result))
+                return dict.fromkeys(self._motor_ids_tuple)
+
+            data_dict = self.groupReadMoving.data_dict
+            results = {}
+            for motor_id in self._motor_ids_tuple:
+                raw = data_dict.get(motor_id)
+                if not raw:
+                    logger.warning(f"Failed to get data for motor ID {motor_id}")
+                    results[motor_id] = None
+                    continue
+                results[motor_id] = raw[0] != 0
+            return results
+
+    async def start_position_polling_async(self, interval: float = 0.01) -> None:
+        """
+        現在位置の一斉受信をバックグラウンドで繰り返し実行します。
+        制御側は latest_positions() で最新値を待たずに取得するか、
+        next_positions_async() で次の受信結果を待つことができ、
+        シリアル通信の待ち時間と制御計算を重ねて実行できます。
+        interval: 受信と受信の間隔 (秒)
+        """
+        if self._polling_task is not None and not self._polling_task.done():
+            return
+        self._polling_error = None
+        self._positions_updated = asyncio.Event()
+        self._polling_task = asyncio.create_task(self._poll_positions(interval))
+
+    async def stop_position_polling_async(self) -> None:
+        """バックグラウンドでの現在位置の受信を停止します。"""
+        task, self._polling_task = self._polling_task, None
+        if task is None:
+            return
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+        except Exception as e:
+            logger.error(f"Position polling task failed: {e!r}")
+
+    async def _poll_positions(self, interval: float) -> None:
+        """
+        現在位置を受信し続け、受信のたびに待機中のコルーチンへ通知します。
+        受信中に例外が起きた場合は受信を止め、待機中のコルーチンにその例外を伝えます。
+        """
+        try:
+            while True:
+                self._latest_positions = await self.get_present_positions_async()
+                # 待機中の next_positions_async を起こし、次の受信用に新しい Event を用意する
+                updated, self._positions_updated = (
+                    self._positions_updated,
+                    asyncio.Event(),
+                )
+                updated.set()
+                await asyncio.sleep(interval)
+        except Exception as e:
+            logger.error(f"Position polling stopped: {e!r}")
+            self._polling_error = e
+            # Event はセットしたままにして、以降の next_positions_async もすぐに例外を返す
+            self._positions_updated.set()
+
+    def latest_positions(self) -> dict[int, int | None]:
+        """バックグラウンドで最後に受信した現在位置(パルス値)を返します。"""
+        return self._latest_positions
+
+    async def next_positions_async(self) -> dict[int, int | None]:
+        """
+        バックグラウンドでの次の受信を待ち、その現在位置(パルス値)を返します。
+        受信が例外で止まっていた場合は RuntimeError を送出します。
+        """
+        await self._positions_updated.wait()
+        if self._polling_error is not None:
+            raise RuntimeError("Position polling stopped") from self._polling_error
+        return self._latest_positions
+
+    async def get_present_positions_rad_async(self) -> dict[int, float | None]:
+        """複数のモーターの現在位置(radian)を一斉受信します。"""
+        positions = await self.get_present_positions_async()
+        rad_per_pulse = self._rad_per_pulse
+        return {
+            motor_id: None if position is None else position * rad_per_pulse[motor_id]
+            for motor_id, position in positions.items()
+        }
+
+    async def set_goal_positions_rad_async(self, positions: dict[int, float]) -> bool:
+        """
+        複数のモーターに目標位置(radian)を一斉送信します。
+        全モーター分をまとめてパルス値に変換し、1回のSyncWriteで送信します。
+        """
+        return await self.set_goal_positions_async(
+            self._radian_goals_to_pulses(positions)
+        )
 
     async def set_torque_enable_async(self, torques: dict[int, bool]) -> bool:
         """複数のモーターのトルクON/OFFを一斉送信します。"""
-        self.groupWriteTorqueEnable.clearParam()
-        for motor_id, enable in torques.items():
-            if motor_id not in self.motors:
-                continue
-
-            value = self.param.TORQUE_ENABLE if enable else self.param.TORQUE_DISABLE
-            param_bytes = int_to_1byte(value)
+        async with self._io_lock:
+            self.groupWriteTorqueEnable.clearParam()
+            for motor_id, enable in torques.items():
+                if motor_id not in self.motors:
+                    continue
+
+                value = (
+                    self.param.TORQUE_ENABLE if enable else self.param.TORQUE_DISABLE
+                )
+                param_bytes = int_to_1byte(value)
 
-            if not self.groupWriteTorqueEnable.addParam(motor_id, param_bytes):
-                logger.error(f"Failed to add param for motor ID {motor_id}")
-                return False
+                if not self.groupWriteTorqueEnable.addParam(motor_id, param_bytes):
+                    logger.error(f"Failed to add param for motor ID {motor_id}")
+                    return False
 
-        dxl_comm_result = await asyncio.to_thread(self.groupWriteTorqueEnable.txPacket)
+            dxl_comm_result = await self._run_io(self.groupWriteTorqueEnable.txPacket)
 
-        if dxl_comm_result != 0:
-            logger.error(self.packetHandler.getTxRxResult(dxl_comm_result))
-            return False
+            if dxl_comm_result != 0:
+                logger.error(self.packetHandler.getTxRxResult(dxl_comm_result))
+                return False
 
-        logger.info(f"Set torque enable for {len(torques)} motors.")
-        return True
+            logger.info(f"Set torque enable for {len(torques)} motors.")
+            return True
 
     async def set_goal_velocities_async(self, velocities: dict[int, int]) -> bool:
         """複数のモーターに目標速度を一斉送信します。"""
-        self.groupWriteGoalVelocity.clearParam()
-        for motor_id, velocity in velocities.items():
-            if motor_id not in self.motors:
-                logger.warning(f"Motor ID {motor_id} not in controller.")
-                continue
+        async with self._io_lock:
+            self.groupWriteGoalVelocity.clearParam()
+            bufs = self._goal_velocity_bufs
+            for motor_id, velocity in velocities.items():
+                if motor_id not in bufs:
+                    logger.warning(f"Motor ID {motor_id} not in controller.")
+                    continue
 
-            param_bytes = int_to_4byte_list(velocity)
+                param_bytes = bufs[motor_id]
+                S_U32.pack_into(param_bytes, 0, velocity & 0xFFFFFFFF)
 
-            if not self.groupWriteGoalVelocity.addParam(motor_id, param_bytes):
-                logger.error(f"Failed to add param for motor ID {motor_id}")
-                return False
+                if not self.groupWriteGoalVelocity.addParam(motor_id, param_bytes):
+                    logger.error(f"Failed to add param for motor ID {motor_id}")
+                    return False
 
-        dxl_comm_result = await asyncio.to_thread(self.groupWriteGoalVelocity.txPacket)
+            dxl_comm_result = await self._run_io(self.groupWriteGoalVelocity.txPacket)
 
-        if dxl_comm_result != 0:
-            logger.error(self.packetHandler.getTxRxResult(dxl_comm_result))
-            return False
+            if dxl_comm_result != 0:
+                logger.error(self.packetHandler.getTxRxResult(dxl_comm_result))
+                return False
 
-        logger.info(f"Set goal velocities for {len(velocities)} motors.")
-        return True
+            logger.debug("Set goal velocities for %d motors.", len(velocities))
+            return True
 
     async def set_operating_modes_async(self, modes: dict[int, OperatingMode]) -> bool:
         """複数のモーターのオペレーティングモードを一斉送信します。"""
-        self.groupWriteOperatingMode.clearParam()
-        for motor_id, mode in modes.items():
-            if motor_id not in self.motors:
-                continue
+        async with self._io_lock:
+            self.groupWriteOperatingMode.clearParam()
+            for motor_id, mode in modes.items():
+                if motor_id not in self.motors:
+                    continue
 
-            param_bytes = int_to_1byte(mode.value)
-            if not self.groupWriteOperatingMode.addParam(motor_id, param_bytes):
-                logger.error(f"Failed to add param for motor ID {motor_id} (Mode)")
-                return False
+                param_bytes = int_to_1byte(mode)
+                if not self.groupWriteOperatingMode.addParam(motor_id, param_bytes):
+                    logger.error(f"Failed to add param for motor ID {motor_id} (Mode)")
+                    return False
 
-        dxl_comm_result = await asyncio.to_thread(self.groupWriteOperatingMode.txPacket)
+            dxl_comm_result = await self._run_io(self.groupWriteOperatingMode.txPacket)
 
-        if dxl_comm_result != 0:
-            logger.error(self.packetHandler.getTxRxResult(dxl_comm_result))
-            return False
+            if dxl_comm_result != 0:
+                logger.error(self.packetHandler.getTxRxResult(dxl_comm_result))
+                return False
 
-        logger.info(f"Set operating modes for {len(modes)} motors.")
-        return True
+            logger.info(f"Set operating modes for {len(modes)} motors.")
+            return True
 
     async def set_goal_currents_async(self, currents: dict[int, int]) -> bool:
         """複数のモーターに目標電流(パルス値)を一斉送信します。"""
-        self.groupWriteGoalCurrent.clearParam()
-        for motor_id, current in currents.items():
-            if motor_id not in self.motors:
-                continue
-
-            param_bytes = int_to_2byte_list(current)
-            if not self.groupWriteGoalCurrent.addParam(motor_id, param_bytes):
-                logger.error(f"Failed to add param for motor ID {motor_id} (Current)")
+        async with self._io_lock:
+            self.groupWriteGoalCurrent.clearParam()
+            bufs = self._goal_current_bufs
+            for motor_id, current in currents.items():
+                if motor_id not in bufs:
+                    continue
+
+                param_bytes = bufs[motor_id]
+                S_U16.pack_into(param_bytes, 0, current & 0xFFFF)
+                if not self.groupWriteGoalCurrent.addParam(motor_id, param_bytes):
+                    logger.error(
+                        f"Failed to add param for motor ID {motor_id} (Current)"
+                    )
+                    return False
+
+            dxl_comm_result = await self._run_io(self.groupWriteGoalCurrent.txPacket)
+
+            if dxl_comm_result != 0:
+                logger.error(self.packetHandler.getTxRxResult(dxl_comm_result))
                 return False
 
-        dxl_comm_result = await asyncio.to_thread(self.groupWriteGoalCurrent.txPacket)
-
-        if dxl_comm_result != 0:
-            logger.error(self.packetHandler.getTxRxResult(dxl_comm_result))
-            return False
-
-        logger.info(f"Set goal currents for {len(currents)} motors.")
-        return True
+            logger.debug("Set goal currents for %d motors.", len(currents))
+            return True
 
     async def set_position_and_current_goals_async(
         self, goals: dict[int, tuple[int, int]]
@@ -299,127 +947,534 @@ class DynamixelController:
         複数のモーターに「目標位置」と「目標電流」を一斉送信します。
         goals: { motor_id: (position, current) }
 
-        注意: ADDR_GOAL_CURRENTとADDR_GOAL_POSITIONは連続していないため、
-        2回に分けてSyncWriteで送信します。
+        ADDR_GOAL_CURRENTとADDR_GOAL_POSITIONは連続していないため、
+        __aenter__ で Indirect Address に割り当てた連続領域へ1回のSyncWriteで送信します。
+        (connect_async だけで接続した場合は割り当てがないので、送信せずに False を返します)
         """
-        # 1. 先に目標電流を設定
-        currents = {motor_id: current for motor_id, (_, current) in goals.items()}
-        if not await self.set_goal_currents_async(currents):
-            logger.error("Failed to set goal currents")
+        if not self._indirect_ready:
+            logger.error(
+                "Indirect address is not configured; "
+                "use 'async with' to set up position and current goals."
+            )
             return False
+        async with self._io_lock:
+            self.groupWritePositionCurrent.clearParam()
+            offsets = self._offsets
+            bufs = self._position_current_bufs
+            for motor_id, (position, current) in goals.items():
+                if motor_id not in offsets:
+                    logger.warning(f"Motor ID {motor_id} not in controller.")
+                    continue
+
+                param_bytes = bufs[motor_id]
+                S_U32.pack_into(
+                    param_bytes, 0, (position + offsets[motor_id]) & 0xFFFFFFFF
+                )
+                S_U16.pack_into(param_bytes, 4, current & 0xFFFF)
+                if not self.groupWritePositionCurrent.addParam(motor_id, param_bytes):
+                    logger.error(f"Failed to add param for motor ID {motor_id}")
+                    return False
 
-        # 2. 次に目標位置を設定
-        positions = {motor_id: position for motor_id, (position, _) in goals.items()}
-        if not await self.set_goal_positions_async(positions):
-            logger.error("Failed to set goal positions")
-            return False
+            dxl_comm_result = await self._run_io(
+                self.groupWritePositionCurrent.txPacket
+            )
 
-        logger.info(f"Set position and current goals for {len(goals)} motors.")
-        return True
+            if dxl_comm_result != 0:
+                logger.error(self.packetHandler.getTxRxResult(dxl_comm_result))
+                return False
+
+            logger.debug("Set position and current goals for %d motors.", len(goals))
+            return True
 
     async def set_position_and_current_goals_rad_async(
         self, goals: dict[int, tuple[float, int]]
     ) -> bool:
         """
-        複数のモーターに「目標位置(radian)」と「目標電流」をBulkWriteで一斉送信します。
+        複数のモーターに「目標位置(radian)」と「目標電流」を一斉送信します。
         goals: { motor_id: (position_rad, current) }
         """
         # ラジアン値をパルス値に変換
         pulse_goals = {}
+        pulse_per_rad = self._pulse_per_rad
         for motor_id, (position_rad, current) in goals.items():
-            if motor_id not in self.motors:
+            if motor_id not in pulse_per_rad:
                 continue
-            pulse_position = self.radian_to_pulse(
-                position_rad,
-                self.motors[motor_id].dynamixel_params.param.PULSE_PER_REVOLUTION,
-            )
+            pulse_position = _radian_to_pulse(position_rad, pulse_per_rad[motor_id])
             pulse_goals[motor_id] = (pulse_position, current)
-            logger.info(
-                f"Motor ID {motor_id}: {position_rad:.3f} rad -> {pulse_position} pulse, current: {current} units"
+            logger.debug(
+                "Motor ID %d: %.3f rad -> %d pulse, current: %d units",
+                motor_id,
+                position_rad,
+                pulse_position,
+                current,
             )
 
         # パルス値を使って既存のメソッドを呼び出す
         return await self.set_position_and_current_goals_async(pulse_goals)
 
+    def _check_motor_ids(self, motor_ids: Iterable[int]) -> None:
+        """コントローラーにないIDが含まれていれば ValueError を送出します。"""
+        unknown_ids = [
+            motor_id for motor_id in motor_ids if motor_id not in self.motors
+        ]
+        if unknown_ids:
+            raise ValueError(f"Motor IDs {unknown_ids} not in controller.")
+
+    async def wait_until_reached_async(
+        self,
+        goal_positions: dict[int, int],
+        tolerance: int = 10,
+        interval: float = 0.01,
+        timeout: float = 3.0,
+    ) -> dict[int, int | None]:
+        """
+        指定したモーターの現在位置が目標位置(パルス値)の tolerance 以内に入るまで、
+        現在位置を一斉受信しながら待ちます。固定時間の sleep と違い、到達した時点で戻ります。
+        確認の間隔は目標から遠いうちは interval 秒とし、残りの偏差が小さくなるほど短くします。
+        戻り値は最後に受信した現在位置です (timeout 秒で打ち切った場合も同様)。
+        コントローラーにないIDを指定すると ValueError を送出します。
+        """
+        self._check_motor_ids(goal_positions)
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        while True:
+            positions = await self.get_present_positions_async()
+            max_error = 0
+            missing = False
+            for motor_id, goal in goal_positions.items():
+                position = positions.get(motor_id)
+                if position is None:
+                    missing = True
+                    continue
+                max_error = max(max_error, abs(goal - position))
+            if not missing and max_error <= tolerance:
+                return positions
+            now = loop.time()
+            if now >= deadline:
+                logger.warning(f"Timed out waiting for goal positions: {positions}")
+                return positions
+            if missing:
+                # 受信できなかったモーターは偏差不明なので、遠いものとして間隔を決める
+                max_error = _REACH_SLOWDOWN_PULSES
+            delay = interval * min(1.0, max_error / _REACH_SLOWDOWN_PULSES)
+            await asyncio.sleep(
+                min(max(delay, _REACH_MIN_POLL_INTERVAL), deadline - now)
+            )
+
+    async def wait_until_reached_rad_async(
+        self,
+        goal_positions: dict[int, float],
+        tolerance: int = 10,
+        interval: float = 0.01,
+        timeout: float = 3.0,
+    ) -> dict[int, int | None]:
+        """
+        目標位置(radian)版の wait_until_reached_async です。
+        tolerance はパルス値で指定し、戻り値も現在位置(パルス値)です。
+        """
+        self._check_motor_ids(goal_positions)
+        return await self.wait_until_reached_async(
+            self._radian_goals_to_pulses(goal_positions), tolerance, interval, timeout
+        )
+
+    async def _setup_indirect_address_async(self) -> bool:
+        """目標位置・目標電流を Indirect Data の連続領域に割り当てます (トルクOFF中に実行)。"""
+        async with self._io_lock:
+            self.groupWriteIndirectAddress.clearParam()
+            for motor_id in self._motor_ids_tuple:
+                if not self.groupWriteIndirectAddress.addParam(
+                    motor_id, POSITION_CURRENT_INDIRECT_PLAN
+                ):
+                    logger.error(
+                        f"Failed to add param for motor ID {motor_id} (Indirect)"
+                    )
+                    return False
+
+            dxl_comm_result = await self._run_io(
+                self.groupWriteIndirectAddress.txPacket
+            )
+
+            if dxl_comm_result != 0:
+                logger.error(self.packetHandler.getTxRxResult(dxl_comm_result))
+                return False
+            self._indirect_ready = True
+            return True
+
     # 非同期接続・切断メソッド
 
     async def connect_async(self) -> bool:
         """接続処理を非同期化"""
         logger.info(f"Connecting to port {self.port} at {self.baudrate.value} bps...")
-        if not await asyncio.to_thread(self.portHandler.openPort):
+        if not await self._run_io(self.portHandler.openPort):
             logger.error("Failed to open the port.")
             return False
-        if not await asyncio.to_thread(
-            self.portHandler.setBaudRate, self.baudrate.value
-        ):
+        if not await self._run_io(self.portHandler.setBaudRate, self.baudrate):
             logger.error("Failed to change the baudrate.")
             return False
-
-        # 接続確認 (ここは個別に実行)
-        for motor_id in self.motors.keys():
-            # _read_2byte はブロッキングなのでラップする
-            value, success = await asyncio.to_thread(
-                self._read_2byte,
-                motor_id,
-                self.param.ADDR_PRESENT_POSITION,
+        if self.latency_timer_ms is not None:
+            await self._run_io(
+                _set_low_latency, self.portHandler, self.latency_timer_ms
             )
-            if not success:
+
+        # 接続確認 (全モーターの存在とモデル番号を確認する)
+        model_numbers = await self._read_model_numbers_async()
+        missing_ids = [
+            motor_id
+            for motor_id, model_number in model_numbers.items()
+            if model_number is None
+        ]
+        if missing_ids:
+            for motor_id in missing_ids:
                 logger.error(f"Failed to connect to motor ID {motor_id}")
-                return False
-            logger.info(f"Successfully connected to motor ID {motor_id}")
+            return False
+        for motor_id, motor in self.motors.items():
+            model_number = model_numbers[motor_id]
+            series = motor.dynamixel_params.series
+            if model_number != series:
+                logger.warning(
+                    f"Motor ID {motor_id} reports model number {model_number}, "
+                    f"but is configured as {series.name} ({series.value})"
+                )
+        logger.info(
+            f"Successfully connected to motor IDs {list(self._motor_ids_tuple)}"
+        )
+
+        if not await self._configure_status_return_async():
+            logger.error("Failed to set status return level.")
+            return False
+
+        if not await self._configure_return_delay_async():
+            # 応答が遅くなるだけで制御はできるので、接続は継続する
+            logger.warning("Failed to set return delay time.")
+
+        # 接続に成功した場合のみ、切断まで Windows のタイマ分解能を1msにする
+        if sys.platform == "win32" and not self._timer_resolution_raised:
+            self._timer_resolution_raised = _set_windows_timer_resolution(True)
 
         logger.info("Successfully connected to all motors.")
         return True
 
+    async def _read_model_numbers_async(self) -> dict[int, int | None]:
+        """
+        全モーターのモデル番号を読み取ります (応答しなかったモーターは None)。
+        Protocol 2.0 では1回の SyncRead で読み取り、SyncRead のない Protocol 1.0 では
+        IDごとに Ping を送ります。SyncRead に失敗した場合も、応答しなかったモーターを
+        特定するために Ping で確認し直します。
+        """
+        async with self._io_lock:
+            if self.protocol_version != ProtocolVersion.V1_0:
+                group_read = self.groupReadModelNumber
+                dxl_comm_result = await self._run_io(group_read.txRxPacket)
+                if dxl_comm_result == 0:
+                    return {
+                        motor_id: S_U16.unpack_from(bytes(raw))[0]
+                        for motor_id, raw in group_read.data_dict.items()
+                    }
+                logger.warning(self.packetHandler.getTxRxResult(dxl_comm_result))
+            return await self._run_io(self._ping_motors)
+
+    def _ping_motors(self) -> dict[int, int | None]:
+        """全モーターに1台ずつ Ping を送り、モデル番号を返します (I/Oスレッド上で呼び出されます)。"""
+        model_numbers: dict[int, int | None] = {}
+        for motor_id in self._motor_ids_tuple:
+            model_number, dxl_comm_result, _ = self.packetHandler.ping(
+                self.portHandler, motor_id
+            )
+            model_numbers[motor_id] = model_number if dxl_comm_result == 0 else None
+        return model_numbers
+
+    async def _configure_status_return_async(self) -> bool:
+        """
+        全モーターの Status Return Level を一斉設定します。
+        変更前の値は切断時に書き戻せるよう記録しておきます。
+        """
+        async with self._io_lock:
+            group_read = self.groupReadStatusReturnLevel
+            dxl_comm_result = await self._run_io(group_read.txRxPacket)
+            if dxl_comm_result != 0:
+                logger.warning(
+                    "Failed to read the status return level; it will not be restored "
+                    f"on disconnect: {self.packetHandler.getTxRxResult(dxl_comm_result)}"
+                )
+                original_levels = {}
+            else:
+                original_levels = {
+                    motor_id: raw[0]
+                    for motor_id, raw in group_read.data_dict.items()
+                    if raw[0] != self.status_return_level
+                }
+
+            self.groupWriteStatusReturnLevel.clearParam()
+            param_bytes = int_to_1byte(self.status_return_level)
+            for motor_id in self._motor_ids_tuple:
+                if not self.groupWriteStatusReturnLevel.addParam(motor_id, param_bytes):
+                    logger.error(
+                        f"Failed to add param for motor ID {motor_id} (Status Return Level)"
+                    )
+                    return False
+
+            dxl_comm_result = await self._run_io(
+                self.groupWriteStatusReturnLevel.txPacket
+            )
+
+            if dxl_comm_result != 0:
+                logger.error(self.packetHandler.getTxRxResult(dxl_comm_result))
+                return False
+            # 前回の切断時に書き戻せなかった値は、最初に記録した値を残す
+            for motor_id, level in original_levels.items():
+                self._original_status_return_levels.setdefault(motor_id, level)
+            return True
+
+    async def _restore_status_return_async(self) -> bool:
+        """接続時に変更した Status Return Level を元の値に一斉に書き戻します。"""
+        original_levels = self._original_status_return_levels
+        if not original_levels:
+            return True
+        async with self._io_lock:
+            self.groupWriteStatusReturnLevel.clearParam()
+            for motor_id, level in original_levels.items():
+                if not self.groupWriteStatusReturnLevel.addParam(
+                    motor_id, int_to_1byte(level)
+                ):
+                    logger.error(
+                        f"Failed to add param for motor ID {motor_id} (Status Return Level)"
+                    )
+                    return False
+
+            dxl_comm_result = await self._run_io(
+                self.groupWriteStatusReturnLevel.txPacket
+            )
+            # ポートを閉じる前に送信完了まで待つ
+            await self._run_io(self.portHandler.ser.flush)
+
+            if dxl_comm_result != 0:
+                logger.error(self.packetHandler.getTxRxResult(dxl_comm_result))
+                return False
+        logger.info(
+            f"Status return level restored for motor IDs {list(original_levels)}"
+        )
+        self._original_status_return_levels = {}
+        return True
+
+    async def _configure_return_delay_async(self) -> bool:
+        """
+        Return Delay Time が0でないモーターに0を一斉設定します。
+        既定値(500us)のままだと、応答パケットのたびにモーター1台あたり500us待たされます。
+        (EEPROM領域のため、トルクOFF中にのみ書き込めます)
+        """
+        if not self._zero_return_delay_ids:
+            return True
+        async with self._io_lock:
+            group_read = self.groupReadReturnDelayTime
+            dxl_comm_result = await self._run_io(group_read.txRxPacket)
+            if dxl_comm_result != 0:
+                logger.error(self.packetHandler.getTxRxResult(dxl_comm_result))
+                return False
+
+            # 書き込みは値が0でないモーターだけに行い、EEPROMの書き換えを避ける
+            self.groupWriteReturnDelayTime.clearParam()
+            changed_ids = []
+            for motor_id in self._zero_return_delay_ids:
+                raw = group_read.data_dict.get(motor_id)
+                if not raw or raw[0] == 0:
+                    continue
+                if not self.groupWriteReturnDelayTime.addParam(
+                    motor_id, int_to_1byte(0)
+                ):
+                    logger.error(
+                        f"Failed to add param for motor ID {motor_id} (Return Delay Time)"
+                    )
+                    return False
+                changed_ids.append(motor_id)
+            if not changed_ids:
+                return True
+
+            dxl_comm_result = await self._run_io(
+                self.groupWriteReturnDelayTime.txPacket
+            )
+            if dxl_comm_result != 0:
+                logger.error(self.packetHandler.getTxRxResult(dxl_comm_result))
+                return False
+
+            # 書き込みには応答がなく、トルクON中は無視されるので、読み直して確認する
+            dxl_comm_result = await self._run_io(group_read.txRxPacket)
+            if dxl_comm_result != 0:
+                logger.error(self.packetHandler.getTxRxResult(dxl_comm_result))
+                return False
+            data_dict = group_read.data_dict
+            failed_ids = [
+                motor_id
+                for motor_id in changed_ids
+                if not data_dict.get(motor_id) or data_dict[motor_id][0] != 0
+            ]
+            if failed_ids:
+                logger.error(
+                    f"Return delay time is still not 0 for motor IDs {failed_ids} "
+                    "(is torque enabled?)"
+                )
+                return False
+            logger.info(f"Return delay time set to 0 for motor IDs {changed_ids}")
+            return True
+
+    async def _broadcast_torque_off_async(self) -> bool:
+        """
+        ブロードキャストIDへの Write 1回で、バス上の全モーターのトルクを無効化します。
+        応答は返らないので送信のみ行い、ポートを閉じる前に送信完了まで待ちます。
+        """
+        if not self.portHandler.is_open:
+            return False
+        dxl_comm_result = await self._run_io(
+            self.packetHandler.write1ByteTxOnly,
+            self.portHandler,
+            BROADCAST_ID,
+            self.param.ADDR_TORQUE_ENABLE,
+            self.param.TORQUE_DISABLE,
+        )
+        await self._run_io(self.portHandler.ser.flush)
+        if dxl_comm_result != 0:
+            logger.error(self.packetHandler.getTxRxResult(dxl_comm_result))
+            return False
+        return True
+
+    async def set_motor_baudrate_async(
+        self, old_baudrate: Baudrate, new_baudrate: Baudrate
+    ) -> bool:
+        """
+        接続前に、全モーターの Baud Rate (EEPROM) を old_baudrate から new_baudrate に変更します。
+        成功するとこのコントローラーのボーレートも new_baudrate になるので、
+        そのまま connect_async / async with で接続できます。
+        (EEPROM領域のため、トルクOFFの状態で実行してください)
+        """
+        if self.portHandler.is_open:
+            logger.error("Motor baudrate must be changed before connecting.")
+            return False
+
+        logger.info(
+            f"Changing motor baudrate on {self.port}: "
+            f"{old_baudrate.value} -> {new_baudrate.value} bps"
+        )
+        if not await self._run_io(self.portHandler.openPort):
+            logger.error("Failed to open the port.")
+            return False
+        try:
+            if not await self._run_io(self.portHandler.setBaudRate, old_baudrate):
+                logger.error("Failed to change the baudrate.")
+                return False
+
+            group_write = GroupSyncWrite(
+                self.portHandler, self.packetHandler, self.param.ADDR_BAUD_RATE, 1
+            )
+            param_bytes = int_to_1byte(BAUDRATE_REGISTER_VALUES[new_baudrate])
+            for motor_id in self._motor_ids_tuple:
+                if not group_write.addParam(motor_id, param_bytes):
+                    logger.error(
+                        f"Failed to add param for motor ID {motor_id} (Baud Rate)"
+                    )
+                    return False
+            async with self._io_lock:
+                dxl_comm_result = await self._run_io(group_write.txPacket)
+                # ポートを閉じる前に送信完了まで待つ
+                await self._run_io(self.portHandler.ser.flush)
+            if dxl_comm_result != 0:
+                logger.error(self.packetHandler.getTxRxResult(dxl_comm_result))
+                return False
+        finally:
+            await self._run_io(self.portHandler.closePort)
+
+        self.baudrate = new_baudrate
+        logger.info(f"Motor baudrate changed to {new_baudrate.value} bps.")
+        return True
+
     async def disconnect_async(self) -> None:
         """切断処理を非同期化"""
+        self._indirect_ready = False
         if self.portHandler.is_open:
-            await asyncio.to_thread(self.portHandler.closePort)
+            await self._restore_status_return_async()
+            await self._run_io(self.portHandler.closePort)
             logger.info("Serial port closed.")
+        if self._timer_resolution_raised:
+            _set_windows_timer_resolution(False)
+            self._timer_resolution_raised = False
+        # ポートを閉じた後はI/Oスレッドを終了する (再接続時には作り直す)
+        if self._io_executor is not None:
+            self._io_executor.shutdown(wait=True)
+            self._io_executor = None
 
     async def __aenter__(self) -> "DynamixelController":
         """with構文の開始時に接続と全モーターのトルクONを行います。"""
         if not await self.connect_async():
+            # 途中まで開いたポートを閉じる
+            await self.disconnect_async()
             raise IOError("Failed to connect to Dynamixel.")
 
         # オペレーティングモードを一斉設定
         # (注: モード設定はトルクOFF中に行う必要があります)
-        all_modes = {
-            motor_id: motor.control_params.ctrl_mode
-            for motor_id, motor in self.motors.items()
-        }
-        if not await self.set_operating_modes_async(all_modes):
+        if not await self.set_operating_modes_async(self._all_modes):
             await self.disconnect_async()
             raise IOError("Failed to set operating mode for all motors.")
 
         logger.info("All motors operating modes set.")
 
+        # 目標位置・目標電流を1回のSyncWriteで送れるよう Indirect Address を設定
+        if not await self._setup_indirect_address_async():
+            await self.disconnect_async()
+            raise IOError("Failed to set indirect address for all motors.")
+
         # 全モーターのトルクを一斉に有効化
-        all_torque_on = {motor_id: True for motor_id in self.motors.keys()}
-        if not await self.set_torque_enable_async(all_torque_on):
+        if not await self.set_torque_enable_async(self._all_torque_on):
             await self.disconnect_async()
             raise IOError("Failed to enable torque for all motors.")
 
         logger.info("All motors torque enabled.")
         return self
 
+    async def wait_until_stopped_async(
+        self,
+        motor_ids: Iterable[int] | None = None,
+        threshold: int = _STOP_VELOCITY_THRESHOLD,
+        consecutive: int = 1,
+        timeout: float = _STOP_TIMEOUT,
+    ) -> bool:
+        """
+        指定したモーター (省略時は全モーター) の現在速度が threshold 未満の状態が
+        consecutive 回続けて確認できるまで待ちます。固定時間の sleep と違い、停止した時点で戻ります。
+        timeout 秒で打ち切った場合は False を返します。
+        """
+        motor_ids = self._motor_ids_tuple if motor_ids is None else tuple(motor_ids)
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        stopped_count = 0
+        while True:
+            velocities = await self.get_present_velocities_async()
+            if all(
+                velocities.get(motor_id) is not None
+                and abs(velocities[motor_id]) < threshold
+                for motor_id in motor_ids
+            ):
+                stopped_count += 1
+                if stopped_count >= consecutive:
+                    return True
+            else:
+                stopped_count = 0
+            if loop.time() >= deadline:
+                logger.warning("Motors did not stop before the timeout.")
+                return False
+            await asyncio.sleep(_STOP_POLL_INTERVAL)
+
     async def __aexit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
         """with構文の終了時に全モーターを停止し、トルクOFFと切断を行います。"""
         logger.info("Safely shutting down...")
-
-        # 速度制御モードのモーターがあれば、速度0を一斉送信
-        velocity_motors = {
-            motor_id: 0
-            for motor_id, motor in self.motors.items()
-            if motor.control_params.ctrl_mode == OperatingMode.VELOCITY_CONTROL
-        }
-        if velocity_motors:
-            await self.set_goal_velocities_async(velocity_motors)
-            await asyncio.sleep(0.2)
-
-        # 全てのモーターのトルクを一斉に無効化
-        all_torque_off = {motor_id: False for motor_id in self.motors.keys()}
-        await self.set_torque_enable_async(all_torque_off)
-
-        await asyncio.sleep(0.1)
-        await self.disconnect_async()
+        try:
+            await self.stop_position_polling_async()
+
+            # 速度制御モードのモーターがあれば、速度0を一斉送信
+            if self._velocity_stop:
+                await self.set_goal_velocities_async(self._velocity_stop)
+                await self.wait_until_stopped_async(self._velocity_stop)
+        finally:
+            # 途中で例外が起きても、トルクOFFと切断は必ず行う
+            try:
+                # 全てのモーターのトルクを一斉に無効化
+                await self._broadcast_torque_off_async()
+            finally:
+                await self.disconnect_async()
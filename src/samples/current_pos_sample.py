@@ -17,7 +17,13 @@
 import asyncio
 import logging
 
-from src.constants import Baudrate, ControlParams, DynamixelSeries, OperatingMode
+from src.constants import (
+    Baudrate,
+    ControlParams,
+    DynamixelSeries,
+    OperatingMode,
+    ma_to_current,
+)
 from src.dynamixel import Dynamixel, DynamixelController
 
 # ロガーの設定
@@ -63,33 +69,34 @@ async def main() -> None:
             # 2. 目標位置(radian)と目標電流を同時に設定
             # 辞書の形式: { motor_id: (position_rad, current_limit) }
             # 注: current_limit の単位はDynamixel内部単位です
-            #     XM430では約2.69mA/unit なので、例えば500mA ≈ 186 units
+            #     XM430では約2.69mA/unit なので、ma_to_current() で変換します
 
-            # 例: モーター4は位置0.0rad、電流制限186units(約500mA)
-            goals = {4: (0.0, 186)}
+            # 例: モーター4は位置0.0rad、電流制限500mA (186units)
+            goals = {4: (0.0, ma_to_current(500))}
 
             await controller.set_position_and_current_goals_rad_async(goals)
             logger.info(f"Position(rad) and Current goals set: {goals}")
 
-            await asyncio.sleep(3.0)  # モーターが移動するのを待つ
-
-            # 3. 移動後の位置を確認
-            new_positions = await controller.get_present_positions_async()
+            # 3. モーターが目標位置に到達するまで待ち (最大3秒)、移動後の位置を確認
+            new_positions = await controller.wait_until_reached_rad_async(
+                {motor_id: position for motor_id, (position, _) in goals.items()}
+            )
             logger.info(f"New positions: {new_positions}")
 
-            await asyncio.sleep(0.5)
+            # 振動が収まる (現在速度が小さい状態が3回続く) まで待つ (最大0.5秒)
+            await controller.wait_until_stopped_async(consecutive=3, timeout=0.5)
 
             # 4. 別の目標値を設定（より大きな電流制限で高速移動）
-            # モーター4は位置-1.0rad、電流制限372units(約1000mA)
-            goals2 = {4: (-1.0, 372)}
+            # モーター4は位置-1.0rad、電流制限1000mA (372units)
+            goals2 = {4: (-1.0, ma_to_current(1000))}
 
             await controller.set_position_and_current_goals_rad_async(goals2)
             logger.info(f"New goals(rad) set: {goals2}")
 
-            await asyncio.sleep(3.0)
-
-            # 5. 最終位置を確認
-            final_positions = await controller.get_present_positions_async()
+            # 5. 目標位置への到達を待ち、最終位置を確認
+            final_positions = await controller.wait_until_reached_rad_async(
+                {motor_id: position for motor_id, (position, _) in goals2.items()}
+            )
             logger.info(f"Final positions: {final_positions}")
 
         # async with ブロックを抜けると、自動的にトルクOFFとポートクローズが実行されます